@@ -0,0 +1,53 @@
+"""Gunicorn configuration for the Country API service"""
+import multiprocessing
+import os
+
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+
+if worker_class == 'gevent':
+    # Patch before the app is preloaded so sockets, threads and psycopg2 all
+    # yield to the event loop; never combine this with async Flask views
+    from gevent import monkey
+    monkey.patch_all()
+
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# Point-in-polygon checks are CPU-bound, so by default scale gthread workers
+# with cores and use threads to overlap the remaining database I/O. Keep the
+# SQLAlchemy pool (pool_size + max_overflow) at least as large as `threads`.
+# For I/O-heavy deployments (cold caches, slow database) gevent workers serve
+# up to `worker_connections` requests each instead, and each can fill its whole
+# pool. Postgres must then accept
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections, so size the pool (or
+# WEB_CONCURRENCY) down to fit max_connections.
+if worker_class == 'gevent':
+    workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+    worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+else:
+    workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+timeout = 120
+
+# Import the app (and warm the country cache) once in the master so workers
+# share the parsed geometries copy-on-write
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+
+def when_ready(server):
+    """Create the schema and warm the country cache once in the master, before workers fork"""
+    from server.app import app, init_db
+
+    init_db(app)
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the master after preloading"""
+    from server.app import app, db
+
+    if app.config.get('SQLALCHEMY_DATABASE_URI'):
+        with app.app_context():
+            db.engine.dispose(close=False)
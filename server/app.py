@@ -1,6 +1,8 @@
-from flask import Flask, request, jsonify, render_template, redirect, url_for, flash
+from flask import Flask, Response, request, jsonify, render_template, redirect, url_for, flash, g
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects import postgresql, sqlite
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user, UserMixin
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SubmitField
@@ -8,13 +10,31 @@ from wtforms.validators import DataRequired
 from dotenv import load_dotenv
 import os
 import json
+import math
+import time
+import functools
+import hashlib
+import threading
+import orjson
 import bcrypt
+from collections import Counter, OrderedDict, namedtuple
+import numpy as np
 try:
-    from shapely.geometry import Point, Polygon
+    import shapely
+    from shapely.geometry import shape
+    # Geometry helpers use the Shapely 2.x vectorized API (prepare, contains_xy,
+    # from_wkb, ...), which always runs in C; Shapely 1.x speedups are not enough
+    if int(shapely.__version__.split('.')[0]) < 2:
+        raise ImportError(f"Shapely>=2.0 required, found {shapely.__version__}")
     SHAPELY_AVAILABLE = True
-except ImportError:
+except ImportError as e:
     SHAPELY_AVAILABLE = False
-    print("Warning: Shapely not available. Some geometry operations will be disabled.")
+    print(f"Warning: Shapely not available ({e}). Some geometry operations will be disabled.")
+try:
+    from numba import njit, boolean, float64
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 from datetime import datetime
 import logging
 
@@ -25,14 +45,19 @@ load_dotenv()
 db = SQLAlchemy()
 login_manager = LoginManager()
 
+# bcrypt work factor for new admin password hashes (existing hashes keep theirs)
+BCRYPT_COST = int(os.getenv('BCRYPT_COST', 12))
+
 # Database Models - Define before create_app to avoid circular imports
 class Country(db.Model):
     __tablename__ = 'countries'
 
     id = db.Column(db.Integer, primary_key=True)
-    country_code = db.Column(db.String(3), unique=True, nullable=False)
+    country_code = db.Column(db.String(3), unique=True, nullable=False, index=True)
     country_name = db.Column(db.String(100), nullable=False)
-    polygon_data = db.Column(db.Text, nullable=False)
+    # Polygons can be megabytes; only load them where the geometry is needed
+    polygon_data = db.deferred(db.Column(db.Text, nullable=False), group='polygon')
+    polygon_wkb = db.deferred(db.Column(db.LargeBinary, nullable=True), group='polygon')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -41,8 +66,9 @@ class Country(db.Model):
             'id': self.id,
             'country_code': self.country_code,
             'country_name': self.country_name,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            # orjson writes datetimes as ISO-8601 itself
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class Admin(UserMixin, db.Model):
@@ -57,7 +83,7 @@ class Admin(UserMixin, db.Model):
 
     def set_password(self, password):
         """Hash and set password"""
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(BCRYPT_COST)).decode('utf-8')
 
     def check_password(self, password):
         """Check if provided password matches hash"""
@@ -68,19 +94,679 @@ class Admin(UserMixin, db.Model):
             'id': self.id,
             'username': self.username,
             'email': self.email,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            # orjson writes datetimes as ISO-8601 itself
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
+# Checked against on logins for unknown usernames; same cost as real hashes
+_DUMMY_PASSWORD_HASH = bcrypt.hashpw(b'dummy-password', bcrypt.gensalt(BCRYPT_COST))
+
 # Forms
 class LoginForm(FlaskForm):
     username = StringField('Username', validators=[DataRequired()])
     password = PasswordField('Password', validators=[DataRequired()])
     submit = SubmitField('Login')
 
+# Helper Functions
+
+# Cached country row with its parsed polygon. `bbox` is (min_lon, min_lat,
+# max_lon, max_lat). `ring` is the (xs, ys) pair of contiguous float64 vertex
+# arrays from simple_ring() for simple polygons (one ring, no holes) when Numba
+# is available, else None.
+# `loaded_at` is a time.monotonic() stamp used to expire the entry.
+CountryRecord = namedtuple('CountryRecord', ['country_code', 'country_name', 'geometry', 'bbox', 'ring', 'loaded_at'])
+
+# Country records keyed by country_code, least recently used first. Writes
+# invalidate entries in this process; the TTL bounds how long other worker
+# processes can serve stale rows.
+_COUNTRY_CACHE = OrderedDict()
+# Guards the caches below against concurrent gthread workers. Held only for
+# dict updates, never across database queries or geometry parsing.
+_CACHE_LOCK = threading.Lock()
+COUNTRY_CACHE_SIZE = 512
+COUNTRY_CACHE_TTL = float(os.getenv('COUNTRY_CACHE_TTL', 300))
+
+# Cache-miss lookup, built once so every miss reuses the same compiled statement
+_BY_CODE_STMT = (
+    db.select(Country)
+    .options(db.undefer_group('polygon'))
+    .where(Country.country_code == db.bindparam('country_code'))
+)
+
+# Spatial index over every country polygon, built lazily by get_country_index().
+# `rings` holds the SoA ring arrays scanned by pip_all when Numba is available.
+# `built_at` is a time.monotonic() stamp; like country records the index is
+# rebuilt after COUNTRY_CACHE_TTL so writes made by other workers show up.
+CountryIndex = namedtuple('CountryIndex', ['tree', 'geometries', 'codes', 'names', 'rings', 'built_at'])
+_COUNTRY_INDEX = None
+# One index build at a time; invalidations bump the generation so a build that
+# raced with a write is returned to its caller but not published
+_INDEX_BUILD_LOCK = threading.Lock()
+_INDEX_GENERATION = 0
+
+# All polygon rings concatenated CSR-style: ring r spans
+# coords[ring_offsets[r]:ring_offsets[r + 1]], and polygon part p spans rings
+# part_offsets[p]:part_offsets[p + 1] (exterior first, then holes).
+RingIndex = namedtuple('RingIndex', ['coords', 'ring_offsets', 'part_offsets', 'part_bbox', 'country_of_part'])
+
+# Weak ETag for /api/v1/countries as (etag, time.monotonic() stamp); expires
+# with the same TTL as country records and is dropped on writes
+_COUNTRIES_ETAG = None
+COUNTRIES_MAX_AGE = 300
+
+# Serialized /api/v1/countries body as (etag, bytes); reused until the ETag changes
+_COUNTRIES_BODY = None
+
+# Postgres-side serialization of the countries list. Timestamps follow
+# datetime.isoformat()/orjson, which omit a zero fraction, so the values match
+# the ORM fallback; only the whitespace json_agg emits differs.
+_COUNTRIES_JSON_SQL = db.text("""
+    SELECT count(*), coalesce(json_agg(json_build_object(
+        'id', id,
+        'country_code', country_code,
+        'country_name', country_name,
+        'created_at', to_char(created_at, CASE WHEN date_trunc('second', created_at) = created_at
+            THEN 'YYYY-MM-DD"T"HH24:MI:SS' ELSE 'YYYY-MM-DD"T"HH24:MI:SS.US' END),
+        'updated_at', to_char(updated_at, CASE WHEN date_trunc('second', updated_at) = updated_at
+            THEN 'YYYY-MM-DD"T"HH24:MI:SS' ELSE 'YYYY-MM-DD"T"HH24:MI:SS.US' END)
+    ) ORDER BY id), '[]')::text
+    FROM countries
+""")
+
+# Upper bound on points accepted by /api/v1/check_batch
+MAX_BATCH_POINTS = 10000
+
+# /api/v1/check and /api/v1/locate payloads are a few small fields; anything
+# bigger is not worth parsing
+MAX_CHECK_BODY = 4096
+
+# Required payload fields per endpoint
+CHECK_FIELDS = ('latitude', 'longitude', 'country_code')
+CHECK_BATCH_FIELDS = ('points', 'country_code')
+LOCATE_FIELDS = ('latitude', 'longitude')
+ADD_COUNTRY_FIELDS = ('country_code', 'country_name', 'polygon_data')
+ADD_COUNTRIES_FIELDS = ('country_code', 'country_name', 'coordinates')
+
+# Error bodies shared by the public endpoints, serialized once with jsonify's sorted keys
+NO_JSON_BODY = orjson.dumps({'success': False, 'error': 'No JSON data provided'}, option=orjson.OPT_SORT_KEYS)
+INVALID_JSON_BODY = orjson.dumps({'success': False, 'error': 'Invalid JSON'}, option=orjson.OPT_SORT_KEYS)
+
+# Simple-polygon countries checked this many times get a specialized kernel
+# with their ring compiled in as a constant, built on a background thread:
+# country_code -> (ring, ring_digest(ring), function). The digest lets a
+# record reloaded after its TTL or LRU eviction reuse the compiled kernel.
+HOT_COUNTRY_THRESHOLD = 1000
+_COUNTRY_HITS = Counter()
+_HOT_PIP = {}
+_HOT_COMPILING = set()
+
+# Seed data for /api/v1/init-db as (country_code, country_name, GeoJSON polygon)
+SAMPLE_COUNTRIES = (
+    ('USA', 'United States', '{"type": "Polygon", "coordinates": [[[-125, 25], [-66, 25], [-66, 49], [-125, 49], [-125, 25]]]}'),
+    ('ISR', 'Israel', '{"type": "Polygon", "coordinates": [[[34.2, 29.5], [35.9, 29.5], [35.9, 33.4], [34.2, 33.4], [34.2, 29.5]]]}'),
+    ('FRA', 'France', '{"type": "Polygon", "coordinates": [[[-5, 42], [8, 42], [8, 52], [-5, 52], [-5, 42]]]}'),
+    ('DEU', 'Germany', '{"type": "Polygon", "coordinates": [[[5.8, 47.3], [15.0, 47.3], [15.0, 55.1], [5.8, 55.1], [5.8, 47.3]]]}'),
+    ('GBR', 'United Kingdom', '{"type": "Polygon", "coordinates": [[[-8, 49], [2, 49], [2, 61], [-8, 61], [-8, 49]]]}'),
+)
+
+# Flask-Login session users keyed by admin id as (SessionAdmin, time.monotonic()
+# stamp). Removing an admin drops it here; other workers notice within the TTL.
+_ADMIN_CACHE = {}
+ADMIN_CACHE_TTL = 30
+
+# Boundary semantics: every containment path (the Numba kernels below and the
+# Shapely contains_xy fallback) treats points on a polygon's boundary, vertices
+# included, as outside. Edge hits are exact for vertices and axis-aligned edges;
+# on diagonal edges the kernels use plain float64 arithmetic where GEOS uses
+# robust predicates, so points within rounding of such an edge may differ.
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def edge_crossing(x, y, xi, yi, xj, yj):
+        """Classify edge (xi, yi)-(xj, yj) for a ray cast right from (x, y): -1 on the edge, 1 crossed, 0 missed."""
+        if (min(xi, xj) <= x <= max(xi, xj) and min(yi, yj) <= y <= max(yi, yj)
+                and (xj - xi) * (y - yi) == (yj - yi) * (x - xi)):
+            return -1
+        if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
+            return 1
+        return 0
+
+    @njit(cache=True)
+    def pip_ray(x, y, xs, ys):
+        """Crossing-number (PNPOLY) point-in-polygon test over ring vertex arrays."""
+        inside = False
+        j = xs.shape[0] - 1
+        for i in range(xs.shape[0]):
+            crossing = edge_crossing(x, y, xs[i], ys[i], xs[j], ys[j])
+            if crossing < 0:
+                return False
+            if crossing:
+                inside = not inside
+            j = i
+        return inside
+
+    @njit(cache=True)
+    def pip_batch(lons, lats, xs, ys):
+        """Run pip_ray for every (lon, lat) pair; returns a boolean array."""
+        out = np.empty(lons.shape[0], dtype=np.bool_)
+        for k in range(lons.shape[0]):
+            out[k] = pip_ray(lons[k], lats[k], xs, ys)
+        return out
+
+    @njit(cache=True)
+    def pip_all(x, y, coords, ring_offsets, part_offsets, part_bbox):
+        """Even-odd ray cast of one point against every polygon part; returns a hit mask."""
+        n_parts = part_bbox.shape[0]
+        hits = np.zeros(n_parts, dtype=np.bool_)
+        for p in range(n_parts):
+            if not (part_bbox[p, 0] <= x <= part_bbox[p, 2] and part_bbox[p, 1] <= y <= part_bbox[p, 3]):
+                continue
+            inside = False
+            on_boundary = False
+            for r in range(part_offsets[p], part_offsets[p + 1]):
+                start = ring_offsets[r]
+                j = ring_offsets[r + 1] - 1
+                for i in range(start, ring_offsets[r + 1]):
+                    crossing = edge_crossing(x, y, coords[i, 0], coords[i, 1], coords[j, 0], coords[j, 1])
+                    if crossing < 0:
+                        on_boundary = True
+                        break
+                    if crossing:
+                        inside = not inside
+                    j = i
+                if on_boundary:
+                    break
+            hits[p] = inside and not on_boundary
+        return hits
+
+    def make_country_pip(ring):
+        """Compile a point-in-polygon function with one country's ring baked in."""
+        xs, ys = ring
+
+        @njit(boolean(float64, float64))
+        def country_pip(x, y):
+            return pip_ray(x, y, xs, ys)
+        return country_pip
+
+class SessionAdmin(UserMixin):
+    """Detached snapshot of an Admin row for Flask-Login; carries no password hash"""
+
+    def __init__(self, id, username):
+        self.id = id
+        self.username = username
+
+def get_session_admin(user_id):
+    """Return the logged-in admin for a session, hitting the database at most once per TTL.
+
+    Runs on every admin request, so it must never verify passwords.
+    """
+    cached = _ADMIN_CACHE.get(user_id)
+    if cached is not None and time.monotonic() - cached[1] < ADMIN_CACHE_TTL:
+        return cached[0]
+
+    row = db.session.execute(
+        db.select(Admin.id, Admin.username).where(Admin.id == user_id)
+    ).one_or_none()
+    if row is None:
+        _ADMIN_CACHE.pop(user_id, None)
+        return None
+    admin = SessionAdmin(row.id, row.username)
+    _ADMIN_CACHE[user_id] = (admin, time.monotonic())
+    return admin
+
+def warm_kernels():
+    """Compile (or load from the on-disk cache) the Numba kernels before the first request."""
+    if not NUMBA_AVAILABLE:
+        return
+
+    empty_ring = np.zeros(3)
+    pip_ray(0.0, 0.0, empty_ring, empty_ring)
+    pip_batch(np.zeros(1), np.zeros(1), empty_ring, empty_ring)
+    pip_all(0.0, 0.0, np.zeros((0, 2)), np.zeros(1, dtype=np.int64),
+            np.zeros(1, dtype=np.int64), np.zeros((0, 4)))
+
+def request_timestamp():
+    """ISO-8601 UTC timestamp for the current request, formatted once and kept on flask.g."""
+    if 'now_iso' not in g:
+        g.now_iso = datetime.utcnow().isoformat()
+    return g.now_iso
+
+def timestamp_version(value):
+    """Integer microsecond version of a datetime for ETags (0 for None)."""
+    return int(value.timestamp() * 1_000_000) if value else 0
+
+def count_rows(model):
+    """SELECT count(*) on a model's table, without Query.count()'s wrapping subquery."""
+    return db.session.execute(db.select(db.func.count()).select_from(model)).scalar_one()
+
+@functools.cache
+def sample_country_rows():
+    """Insert rows for SAMPLE_COUNTRIES with their WKB, converted once per process."""
+    polygon_wkbs = [None] * len(SAMPLE_COUNTRIES)
+    if SHAPELY_AVAILABLE:
+        polygon_wkbs = shapely.to_wkb(shapely.from_geojson([polygon for _, _, polygon in SAMPLE_COUNTRIES]),
+                                      include_srid=False)
+    return tuple(
+        {'country_code': code, 'country_name': name, 'polygon_data': polygon, 'polygon_wkb': polygon_wkb}
+        for (code, name, polygon), polygon_wkb in zip(SAMPLE_COUNTRIES, polygon_wkbs)
+    )
+
+def insert_new_countries(rows):
+    """Insert country row dicts, skipping codes that already exist; returns the inserted codes."""
+    dialect_insert = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}.get(db.engine.dialect.name)
+    if dialect_insert is None:
+        # No ON CONFLICT support: check existing codes first
+        existing_codes = {
+            code for (code,) in db.session.query(Country.country_code)
+            .filter(Country.country_code.in_([row['country_code'] for row in rows]))
+        }
+        rows = [row for row in rows if row['country_code'] not in existing_codes]
+        db.session.bulk_insert_mappings(Country, rows)
+        return {row['country_code'] for row in rows}
+
+    # The unique constraint decides what is new, so concurrent loads cannot race
+    stmt = (
+        dialect_insert(Country)
+        .on_conflict_do_nothing(index_elements=['country_code'])
+        .returning(Country.country_code)
+    )
+    return set(db.session.scalars(stmt, rows))
+
+def get_countries_etag():
+    """Weak ETag for the countries list: row count plus the latest updated_at."""
+    global _COUNTRIES_ETAG
+    if _COUNTRIES_ETAG is not None and time.monotonic() - _COUNTRIES_ETAG[1] < COUNTRY_CACHE_TTL:
+        return _COUNTRIES_ETAG[0]
+
+    count, last_updated = db.session.execute(
+        db.select(db.func.count(Country.id), db.func.max(Country.updated_at))
+    ).one()
+    etag = f'{count}-{timestamp_version(last_updated)}'
+    _COUNTRIES_ETAG = (etag, time.monotonic())
+    return etag
+
+def get_countries_body(etag):
+    """Return the serialized countries list for an ETag, building it once per version."""
+    global _COUNTRIES_BODY
+    cached = _COUNTRIES_BODY
+    if cached is not None and cached[0] == etag:
+        return cached[1]
+
+    if db.engine.dialect.name == 'postgresql':
+        # Let Postgres build the array; ::text stops psycopg2 from decoding it into Python objects
+        count, data = db.session.execute(_COUNTRIES_JSON_SQL).one()
+        body = b'{"success":true,"data":%s,"count":%d}' % (data.encode('utf-8'), count)
+    else:
+        countries = db.session.execute(
+            db.select(Country)
+            .options(db.load_only(Country.id, Country.country_code, Country.country_name,
+                                  Country.created_at, Country.updated_at))
+            .order_by(Country.id)
+            .execution_options(yield_per=200)
+        ).scalars()
+        data = [country.to_dict() for country in countries]
+        body = orjson.dumps({'success': True, 'data': data, 'count': len(data)})
+    _COUNTRIES_BODY = (etag, body)
+    return body
+
+def cacheable(response, etag):
+    """Attach a weak ETag and public Cache-Control to a country metadata response."""
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = f'public, max-age={COUNTRIES_MAX_AGE}'
+    return response
+
+def read_body(limit):
+    """Return the request body, or None if it is longer than limit bytes.
+
+    Content-Length is checked first, but chunked requests carry none, so the
+    stream itself is read no further than limit + 1 bytes.
+    """
+    if request.content_length is not None and request.content_length > limit:
+        return None
+    chunks = []
+    remaining = limit + 1
+    while remaining > 0:
+        chunk = request.stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    if remaining <= 0:
+        return None
+    return b''.join(chunks)
+
+def parse_coordinate(data):
+    """Return (latitude, longitude, error) from a request payload; error is None when valid."""
+    try:
+        latitude = float(data['latitude'])
+        longitude = float(data['longitude'])
+    except (ValueError, TypeError):
+        return None, None, 'Invalid latitude or longitude format'
+
+    # float() accepts 'nan' and 'inf'; reject them before they reach the ray-cast
+    if not (math.isfinite(latitude) and math.isfinite(longitude)):
+        return None, None, 'Invalid latitude or longitude format'
+    if not -90.0 <= latitude <= 90.0:
+        return None, None, 'Latitude must be between -90 and 90'
+    if not -180.0 <= longitude <= 180.0:
+        return None, None, 'Longitude must be between -180 and 180'
+    return latitude, longitude, None
+
+def load_polygon(polygon_data):
+    """Parse GeoJSON polygon text into a Shapely geometry, or None if unusable."""
+    try:
+        return parse_polygon(orjson.loads(polygon_data))
+    except orjson.JSONDecodeError as e:
+        print(f"Error processing polygon data: {e}")
+        return None
+
+def parse_polygon(polygon_json):
+    """Build a Shapely geometry from already-parsed GeoJSON, or None if unusable."""
+    if not SHAPELY_AVAILABLE:
+        return None
+
+    try:
+        if polygon_json['type'] not in ('Polygon', 'MultiPolygon'):
+            return None
+        return shape(polygon_json)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        print(f"Error processing polygon data: {e}")
+        return None
+
+def polygon_to_wkb(geometry):
+    """Serialize a geometry to WKB for the polygon_wkb column, or None."""
+    if not SHAPELY_AVAILABLE or geometry is None:
+        return None
+    return shapely.to_wkb(geometry, include_srid=False)
+
+def simple_ring(geometry):
+    """Return a hole-free Polygon's exterior as (xs, ys) float64 vertex arrays, else None.
+
+    The closing vertex is dropped; pip_ray wraps from the last vertex back to
+    the first. Coordinates stay in float64 like the bbox and RingIndex, so
+    border points get the same answer from every path.
+    """
+    if not NUMBA_AVAILABLE or geometry.geom_type != 'Polygon' or geometry.interiors:
+        return None
+
+    ring = np.asarray(geometry.exterior.coords, dtype=np.float64)[:-1, :2]
+    if len(ring) < 3:
+        return None
+    return np.ascontiguousarray(ring[:, 0]), np.ascontiguousarray(ring[:, 1])
+
+def build_country_record(country):
+    """Parse a Country row into a CountryRecord and store it in the cache."""
+    geometry = None
+    if SHAPELY_AVAILABLE:
+        if country.polygon_wkb:
+            geometry = shapely.from_wkb(country.polygon_wkb)
+        else:
+            geometry = load_polygon(country.polygon_data)
+    return cache_country_record(country.country_code, country.country_name, geometry)
+
+def cache_country_record(country_code, country_name, geometry):
+    """Prepare an already-built geometry and store its CountryRecord in the cache."""
+    bbox = ring = None
+    if geometry is not None:
+        shapely.prepare(geometry)
+        bbox = geometry.bounds
+        ring = simple_ring(geometry)
+
+    record = CountryRecord(country_code, country_name, geometry, bbox, ring, time.monotonic())
+    with _CACHE_LOCK:
+        _COUNTRY_CACHE[country_code] = record
+        _COUNTRY_CACHE.move_to_end(country_code)
+        while len(_COUNTRY_CACHE) > COUNTRY_CACHE_SIZE:
+            _COUNTRY_CACHE.popitem(last=False)
+    return record
+
+def get_country_record(country_code):
+    """Return the cached CountryRecord for a code, loading it from the database on a miss."""
+    with _CACHE_LOCK:
+        record = _COUNTRY_CACHE.get(country_code)
+        if record is not None and time.monotonic() - record.loaded_at < COUNTRY_CACHE_TTL:
+            _COUNTRY_CACHE.move_to_end(country_code)
+            return record
+
+    country = db.session.execute(_BY_CODE_STMT, {'country_code': country_code}).scalar_one_or_none()
+    if not country:
+        with _CACHE_LOCK:
+            _COUNTRY_CACHE.pop(country_code, None)
+        return None
+    return build_country_record(country)
+
+def invalidate_country_cache(country_code=None):
+    """Drop cached polygons (one country or all), the spatial index and list ETag after a write."""
+    global _COUNTRY_INDEX, _INDEX_GENERATION, _COUNTRIES_ETAG, _COUNTRIES_BODY
+    with _CACHE_LOCK:
+        if country_code is None:
+            _COUNTRY_CACHE.clear()
+            _COUNTRY_HITS.clear()
+            _HOT_PIP.clear()
+        else:
+            _COUNTRY_CACHE.pop(country_code, None)
+            _COUNTRY_HITS.pop(country_code, None)
+            _HOT_PIP.pop(country_code, None)
+        _COUNTRY_INDEX = None
+        _INDEX_GENERATION += 1
+        _COUNTRIES_ETAG = None
+        _COUNTRIES_BODY = None
+
+def warm_country_cache():
+    """Parse every country up front so requests never pay the first-hit parse."""
+    invalidate_country_cache()
+    if SHAPELY_AVAILABLE:
+        get_country_index()
+    else:
+        for country in Country.query.options(db.undefer_group('polygon')):
+            build_country_record(country)
+
+def get_country_index():
+    """Return the STRtree over all country polygons, building it on first use or once expired."""
+    global _COUNTRY_INDEX
+    index = _COUNTRY_INDEX
+    if index is not None and time.monotonic() - index.built_at < COUNTRY_CACHE_TTL:
+        return index
+
+    # Serve the expired index while another thread rebuilds it; only wait when there is none
+    if not _INDEX_BUILD_LOCK.acquire(blocking=index is None):
+        return index
+    try:
+        # Another thread may have built it while we waited
+        current = _COUNTRY_INDEX
+        if current is not None and time.monotonic() - current.built_at < COUNTRY_CACHE_TTL:
+            return current
+
+        generation = _INDEX_GENERATION
+        index = build_country_index()
+        with _CACHE_LOCK:
+            if _INDEX_GENERATION == generation:
+                _COUNTRY_INDEX = index
+        return index
+    finally:
+        _INDEX_BUILD_LOCK.release()
+
+def build_country_index():
+    """Load and parse every country into a fresh CountryIndex, without holding _CACHE_LOCK."""
+    geometries, codes, names = [], [], []
+    for country in Country.query.options(db.undefer_group('polygon')):
+        record = build_country_record(country)
+        if record.geometry is None:
+            continue
+        geometries.append(record.geometry)
+        codes.append(record.country_code)
+        names.append(record.country_name)
+
+    rings = build_ring_index(geometries) if NUMBA_AVAILABLE else None
+    geometries = np.asarray(geometries, dtype=object)
+    return CountryIndex(shapely.STRtree(geometries), geometries, codes, names, rings, time.monotonic())
+
+def build_ring_index(geometries):
+    """Flatten country geometries into the contiguous RingIndex arrays."""
+    ring_arrays, ring_offsets, part_offsets, part_bbox, country_of_part = [], [0], [0], [], []
+    for country_index, geometry in enumerate(geometries):
+        for part in shapely.get_parts(geometry):
+            for ring in (part.exterior, *part.interiors):
+                ring_coords = shapely.get_coordinates(ring)
+                ring_arrays.append(ring_coords)
+                ring_offsets.append(ring_offsets[-1] + len(ring_coords))
+            part_offsets.append(len(ring_offsets) - 1)
+            part_bbox.append(part.bounds)
+            country_of_part.append(country_index)
+
+    return RingIndex(
+        coords=np.ascontiguousarray(np.concatenate(ring_arrays) if ring_arrays else np.empty((0, 2)), dtype=np.float64),
+        ring_offsets=np.asarray(ring_offsets, dtype=np.int64),
+        part_offsets=np.asarray(part_offsets, dtype=np.int64),
+        part_bbox=np.asarray(part_bbox, dtype=np.float64).reshape(-1, 4),
+        country_of_part=np.asarray(country_of_part, dtype=np.int64)
+    )
+
+def locate_point(lat, lon):
+    """Return [{country_code, country_name}] for every country containing the point."""
+    if not SHAPELY_AVAILABLE:
+        print("Warning: Cannot perform point-in-polygon check without Shapely library")
+        return []
+
+    index = get_country_index()
+    if index.rings is not None:
+        rings = index.rings
+        hits = pip_all(lon, lat, rings.coords, rings.ring_offsets, rings.part_offsets, rings.part_bbox)
+        matches = np.unique(rings.country_of_part[hits])
+    else:
+        # The tree only narrows candidates by bbox; the prepared country
+        # geometries then answer contains_xy on the raw coordinates
+        candidates = index.tree.query(shapely.points(lon, lat))
+        matches = candidates[shapely.contains_xy(index.geometries[candidates], lon, lat)]
+    return [
+        {'country_code': index.codes[i], 'country_name': index.names[i]}
+        for i in sorted(matches)
+    ]
+
+def is_point_in_polygon(lat, lon, polygon):
+    """Check if a point (lat, lon) is inside a cached CountryRecord polygon."""
+    if not SHAPELY_AVAILABLE:
+        print("Warning: Cannot perform point-in-polygon check without Shapely library")
+        return False
+
+    if polygon is None or polygon.geometry is None:
+        return False
+
+    # Cheap bounding-box rejection before the full containment test
+    min_lon, min_lat, max_lon, max_lat = polygon.bbox
+    if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+        return False
+
+    # Note: both paths use (x, y) = (lon, lat)
+    if polygon.ring is not None:
+        return bool(hot_country_pip(polygon)(lon, lat))
+    return bool(shapely.contains_xy(polygon.geometry, lon, lat))
+
+def ring_digest(ring):
+    """Content hash of simple_ring() vertex arrays."""
+    return hashlib.blake2b(b''.join(values.tobytes() for values in ring), digest_size=16).digest()
+
+def hot_country_pip(polygon):
+    """Return the ray-cast function for a simple polygon, specializing it once the country is hot."""
+    country_code = polygon.country_code
+    hot = _HOT_PIP.get(country_code)
+    if hot is not None:
+        if hot[0] is polygon.ring:
+            return hot[2]
+        # Reloaded record: same vertices keep the kernel, changed ones start over
+        matches = hot[1] == ring_digest(polygon.ring)
+        with _CACHE_LOCK:
+            if matches:
+                _HOT_PIP[country_code] = (polygon.ring, hot[1], hot[2])
+            else:
+                _HOT_PIP.pop(country_code, None)
+                _COUNTRY_HITS.pop(country_code, None)
+        if matches:
+            return hot[2]
+
+    with _CACHE_LOCK:
+        _COUNTRY_HITS[country_code] += 1
+        compile_now = (_COUNTRY_HITS[country_code] >= HOT_COUNTRY_THRESHOLD
+                       and country_code not in _HOT_COMPILING)
+        if compile_now:
+            _HOT_COMPILING.add(country_code)
+    if compile_now:
+        # Compiling takes tens of milliseconds; keep it off the request
+        threading.Thread(target=compile_country_pip, args=(country_code, polygon.ring), daemon=True).start()
+
+    xs, ys = polygon.ring
+    return lambda x, y: pip_ray(x, y, xs, ys)
+
+def compile_country_pip(country_code, ring):
+    """Build and publish the specialized kernel for one hot country."""
+    try:
+        entry = (ring, ring_digest(ring), make_country_pip(ring))
+        with _CACHE_LOCK:
+            _HOT_PIP[country_code] = entry
+    finally:
+        with _CACHE_LOCK:
+            _HOT_COMPILING.discard(country_code)
+
+def points_in_polygon(lats, lons, polygon):
+    """Vectorized point-in-polygon check; returns a boolean array."""
+    results = np.zeros(len(lats), dtype=bool)
+    if not SHAPELY_AVAILABLE:
+        print("Warning: Cannot perform point-in-polygon check without Shapely library")
+        return results
+
+    if polygon is None or polygon.geometry is None:
+        return results
+
+    # Only points inside the bounding box reach the edge loop
+    min_lon, min_lat, max_lon, max_lat = polygon.bbox
+    candidates = (lons >= min_lon) & (lons <= max_lon) & (lats >= min_lat) & (lats <= max_lat)
+    if not candidates.any():
+        return results
+
+    if polygon.ring is not None:
+        results[candidates] = pip_batch(lons[candidates], lats[candidates], *polygon.ring)
+    else:
+        results[candidates] = shapely.contains_xy(polygon.geometry, lons[candidates], lats[candidates])
+    return results
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for jsonify and request.get_json"""
+
+    mimetype = 'application/json'
+    # Same default as Flask's DefaultJSONProvider; app.json.sort_keys = False turns it off
+    sort_keys = True
+
+    def options(self):
+        if self.sort_keys:
+            return orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+        return orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options()).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            # orjson has no object_hook; Flask's session serializer needs it to untag values
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Same argument rules as jsonify(): one positional value, several as a list, or kwargs
+        if args and kwargs:
+            raise TypeError('app.json.response() takes either args or kwargs, not both')
+        if len(args) == 1:
+            obj = args[0]
+        elif args:
+            obj = list(args)
+        else:
+            obj = kwargs or None
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        return self._app.response_class(orjson.dumps(obj, option=self.options()), mimetype=self.mimetype)
+
 def create_app():
     print("Creating Flask application...")
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Configure logging first
     logging.basicConfig(level=logging.INFO)
@@ -93,6 +779,16 @@ def create_app():
     if database_url:
         app.config['SQLALCHEMY_DATABASE_URI'] = database_url
         app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+        if not database_url.startswith('sqlite'):
+            # Size the pool for concurrent /check traffic and drop dead or stale connections;
+            # LIFO checkout keeps reusing the most recently warm connection
+            app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+                'pool_size': int(os.getenv('DB_POOL_SIZE', 20)),
+                'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 40)),
+                'pool_pre_ping': True,
+                'pool_recycle': 600,
+                'pool_use_lifo': True
+            }
         app.logger.info("Database URL configured")
 
         # Initialize database extension only if URL is provided
@@ -112,7 +808,7 @@ def create_app():
 
     @login_manager.user_loader
     def load_user(user_id):
-        return Admin.query.get(int(user_id))
+        return get_session_admin(int(user_id))
 
     try:
         CORS(app, origins=os.getenv('CORS_ORIGINS', '*').split(','))
@@ -131,7 +827,10 @@ def create_app():
             'endpoints': {
                 'status': '/api/v1/status',
                 'countries': '/api/v1/countries',
+                'country': '/api/v1/countries/<country_code>',
                 'check': '/api/v1/check',
+                'check_batch': '/api/v1/check_batch (POST)',
+                'locate': '/api/v1/locate (POST)',
                 'init-db': '/api/v1/init-db (POST)'
             }
         })
@@ -141,7 +840,7 @@ def create_app():
         """Simple status check endpoint without database dependency"""
         return jsonify({
             'status': 'running',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': request_timestamp(),
             'version': '1.0.0',
             'service': 'Country API'
         })
@@ -151,51 +850,15 @@ def create_app():
         """Initialize database with tables and sample data"""
         try:
             # Create tables
-            db.create_all()
-
-            # Sample countries data
-            sample_countries = [
-                {
-                    "country_code": "USA",
-                    "country_name": "United States",
-                    "polygon_data": '{"type": "Polygon", "coordinates": [[[-125, 25], [-66, 25], [-66, 49], [-125, 49], [-125, 25]]]}'
-                },
-                {
-                    "country_code": "ISR",
-                    "country_name": "Israel",
-                    "polygon_data": '{"type": "Polygon", "coordinates": [[[34.2, 29.5], [35.9, 29.5], [35.9, 33.4], [34.2, 33.4], [34.2, 29.5]]]}'
-                },
-                {
-                    "country_code": "FRA",
-                    "country_name": "France",
-                    "polygon_data": '{"type": "Polygon", "coordinates": [[[-5, 42], [8, 42], [8, 52], [-5, 52], [-5, 42]]]}'
-                },
-                {
-                    "country_code": "DEU",
-                    "country_name": "Germany",
-                    "polygon_data": '{"type": "Polygon", "coordinates": [[[5.8, 47.3], [15.0, 47.3], [15.0, 55.1], [5.8, 55.1], [5.8, 47.3]]]}'
-                },
-                {
-                    "country_code": "GBR",
-                    "country_name": "United Kingdom",
-                    "polygon_data": '{"type": "Polygon", "coordinates": [[[-8, 49], [2, 49], [2, 61], [-8, 61], [-8, 49]]]}'
-                }
-            ]
-
-            # Add sample countries
-            added_countries = []
-            for country_data in sample_countries:
-                existing = Country.query.filter_by(country_code=country_data["country_code"]).first()
-                if not existing:
-                    country = Country(
-                        country_code=country_data["country_code"],
-                        country_name=country_data["country_name"],
-                        polygon_data=country_data["polygon_data"]
-                    )
-                    db.session.add(country)
-                    added_countries.append(country_data["country_code"])
+            ensure_schema()
 
+            # Add sample countries that are not in the database yet
+            inserted_codes = insert_new_countries(sample_country_rows())
             db.session.commit()
+            if inserted_codes:
+                warm_country_cache()
+
+            added_countries = [code for code, _, _ in SAMPLE_COUNTRIES if code in inserted_codes]
 
             return jsonify({
                 'success': True,
@@ -216,12 +879,37 @@ def create_app():
     def get_countries():
         """Get list of all available countries"""
         try:
-            countries = Country.query.all()
+            etag = get_countries_etag()
+            if request.if_none_match.contains_weak(etag):
+                return cacheable(Response(status=304), etag)
+
+            return cacheable(Response(get_countries_body(etag), mimetype='application/json'), etag)
+        except Exception as e:
             return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+
+    @app.route('/api/v1/countries/<country_code>', methods=['GET'])
+    def get_country(country_code):
+        """Get a single country by code"""
+        try:
+            country_code = country_code.upper()
+            country = Country.query.filter_by(country_code=country_code).first()
+            if not country:
+                return jsonify({
+                    'success': False,
+                    'error': f'Country with code {country_code} not found'
+                }), 404
+
+            etag = f'{country.id}-{timestamp_version(country.updated_at)}'
+            if request.if_none_match.contains_weak(etag):
+                return cacheable(Response(status=304), etag)
+
+            return cacheable(jsonify({
                 'success': True,
-                'data': [country.to_dict() for country in countries],
-                'count': len(countries)
-            })
+                'data': country.to_dict()
+            }), etag)
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -241,17 +929,92 @@ def create_app():
         }
         """
         try:
-            data = request.get_json()
+            # Parse the body directly; get_json() would also cache it on the request
+            raw = read_body(MAX_CHECK_BODY)
+            if raw is None:
+                return jsonify({
+                    'success': False,
+                    'error': f'Request body must be at most {MAX_CHECK_BODY} bytes'
+                }), 413
+            try:
+                data = orjson.loads(raw) if raw else None
+            except orjson.JSONDecodeError:
+                return Response(INVALID_JSON_BODY, status=400, mimetype='application/json')
 
             # Validate required fields
-            if not data:
+            if not data or not isinstance(data, dict):
+                return Response(NO_JSON_BODY, status=400, mimetype='application/json')
+
+            missing_fields = [field for field in CHECK_FIELDS if field not in data]
+
+            if missing_fields:
                 return jsonify({
                     'success': False,
-                    'error': 'No JSON data provided'
+                    'error': f'Missing required fields: {", ".join(missing_fields)}'
+                }), 400
+
+            # Extract and validate coordinates
+            latitude, longitude, error = parse_coordinate(data)
+            if error:
+                return jsonify({
+                    'success': False,
+                    'error': error
                 }), 400
 
-            required_fields = ['latitude', 'longitude', 'country_code']
-            missing_fields = [field for field in required_fields if field not in data]
+            country_code = data['country_code'].upper()
+
+            # Find country in the in-process cache, falling back to the database
+            country = get_country_record(country_code)
+            if not country:
+                return jsonify({
+                    'success': False,
+                    'error': f'Country with code {country_code} not found'
+                }), 404
+
+            # Check if point is inside country polygon
+            is_inside = is_point_in_polygon(latitude, longitude, country)
+
+            return jsonify({
+                'success': True,
+                'data': {
+                    'is_inside_country': is_inside,
+                    'latitude': latitude,
+                    'longitude': longitude,
+                    'country_code': country_code,
+                    'country_name': country.country_name,
+                    'checked_at': request_timestamp()
+                }
+            })
+
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': f'Internal server error: {str(e)}'
+            }), 500
+
+    @app.route('/api/v1/check_batch', methods=['POST'])
+    def check_coordinates_batch():
+        """
+        Check many coordinates against one country in a single request.
+
+        Expected JSON payload:
+        {
+            "country_code": "USA",
+            "points": [[40.7128, -74.0060], [51.5074, -0.1278]]
+        }
+        """
+        try:
+            # Parse the body directly so malformed JSON is a 400, not get_json()'s BadRequest
+            raw = request.get_data(cache=False)
+            try:
+                data = orjson.loads(raw) if raw else None
+            except orjson.JSONDecodeError:
+                return Response(INVALID_JSON_BODY, status=400, mimetype='application/json')
+
+            if not data or not isinstance(data, dict):
+                return Response(NO_JSON_BODY, status=400, mimetype='application/json')
+
+            missing_fields = [field for field in CHECK_BATCH_FIELDS if field not in data]
 
             if missing_fields:
                 return jsonify({
@@ -259,24 +1022,45 @@ def create_app():
                     'error': f'Missing required fields: {", ".join(missing_fields)}'
                 }), 400
 
-            # Extract and validate coordinates
+            # Extract and validate coordinates as an (N, 2) array of [lat, lon]
             try:
-                latitude = float(data['latitude'])
-                longitude = float(data['longitude'])
+                points = np.asarray(data['points'], dtype=np.float64)
             except (ValueError, TypeError):
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid points format'
+                }), 400
+
+            if points.ndim != 2 or points.shape[1] != 2 or len(points) == 0:
+                return jsonify({
+                    'success': False,
+                    'error': 'Points must be a non-empty list of [latitude, longitude] pairs'
+                }), 400
+
+            if len(points) > MAX_BATCH_POINTS:
+                return jsonify({
+                    'success': False,
+                    'error': f'At most {MAX_BATCH_POINTS} points can be checked per request'
+                }), 400
+
+            # Same check as parse_coordinate: 'nan' and 'inf' convert to floats
+            if not np.isfinite(points).all():
                 return jsonify({
                     'success': False,
                     'error': 'Invalid latitude or longitude format'
                 }), 400
 
+            latitudes = points[:, 0]
+            longitudes = points[:, 1]
+
             # Validate coordinate ranges
-            if not (-90 <= latitude <= 90):
+            if not ((latitudes >= -90) & (latitudes <= 90)).all():
                 return jsonify({
                     'success': False,
                     'error': 'Latitude must be between -90 and 90'
                 }), 400
 
-            if not (-180 <= longitude <= 180):
+            if not ((longitudes >= -180) & (longitudes <= 180)).all():
                 return jsonify({
                     'success': False,
                     'error': 'Longitude must be between -180 and 180'
@@ -284,26 +1068,87 @@ def create_app():
 
             country_code = data['country_code'].upper()
 
-            # Find country in database
-            country = Country.query.filter_by(country_code=country_code).first()
+            # Find country in the in-process cache, falling back to the database
+            country = get_country_record(country_code)
             if not country:
                 return jsonify({
                     'success': False,
                     'error': f'Country with code {country_code} not found'
                 }), 404
 
-            # Check if point is inside country polygon
-            is_inside = is_point_in_polygon(latitude, longitude, country.polygon_data)
+            # Check all points against the country polygon at once
+            results = points_in_polygon(latitudes, longitudes, country)
 
             return jsonify({
                 'success': True,
                 'data': {
-                    'is_inside_country': is_inside,
-                    'latitude': latitude,
-                    'longitude': longitude,
+                    'results': results.tolist(),
+                    'count': len(results),
                     'country_code': country_code,
                     'country_name': country.country_name,
-                    'checked_at': datetime.utcnow().isoformat()
+                    'checked_at': request_timestamp()
+                }
+            })
+
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': f'Internal server error: {str(e)}'
+            }), 500
+
+    @app.route('/api/v1/locate', methods=['POST'])
+    def locate_coordinate():
+        """
+        Find which countries contain a coordinate.
+
+        Expected JSON payload:
+        {
+            "latitude": 40.7128,
+            "longitude": -74.0060
+        }
+        """
+        try:
+            # Parse the body directly; get_json() would also cache it on the request
+            raw = read_body(MAX_CHECK_BODY)
+            if raw is None:
+                return jsonify({
+                    'success': False,
+                    'error': f'Request body must be at most {MAX_CHECK_BODY} bytes'
+                }), 413
+            try:
+                data = orjson.loads(raw) if raw else None
+            except orjson.JSONDecodeError:
+                return Response(INVALID_JSON_BODY, status=400, mimetype='application/json')
+
+            if not data or not isinstance(data, dict):
+                return Response(NO_JSON_BODY, status=400, mimetype='application/json')
+
+            missing_fields = [field for field in LOCATE_FIELDS if field not in data]
+
+            if missing_fields:
+                return jsonify({
+                    'success': False,
+                    'error': f'Missing required fields: {", ".join(missing_fields)}'
+                }), 400
+
+            # Extract and validate coordinates
+            latitude, longitude, error = parse_coordinate(data)
+            if error:
+                return jsonify({
+                    'success': False,
+                    'error': error
+                }), 400
+
+            countries = locate_point(latitude, longitude)
+
+            return jsonify({
+                'success': True,
+                'data': {
+                    'countries': countries,
+                    'count': len(countries),
+                    'latitude': latitude,
+                    'longitude': longitude,
+                    'checked_at': request_timestamp()
                 }
             })
 
@@ -350,7 +1195,15 @@ def create_app():
         form = LoginForm()
         if form.validate_on_submit():
             admin = Admin.query.filter_by(username=form.username.data).first()
-            if admin and admin.check_password(form.password.data):
+            if admin:
+                password_ok = admin.check_password(form.password.data)
+            else:
+                # Spend the same bcrypt work for unknown usernames so response
+                # time does not reveal which usernames exist
+                bcrypt.checkpw(form.password.data.encode('utf-8'), _DUMMY_PASSWORD_HASH)
+                password_ok = False
+
+            if password_ok:
                 login_user(admin)
                 flash('Logged in successfully!', 'success')
                 return redirect(url_for('admin_dashboard'))
@@ -381,7 +1234,7 @@ def create_app():
             db.create_all()
 
             # Check if any admin exists
-            admin_count = Admin.query.count()
+            admin_count = count_rows(Admin)
             if admin_count == 0:
                 # Create default admin with your credentials
                 default_admin = Admin(
@@ -421,7 +1274,7 @@ def create_app():
             db.create_all()
 
             # Check if any admin exists
-            admin_count = Admin.query.count()
+            admin_count = count_rows(Admin)
             if admin_count == 0:
                 # Create default admin
                 default_admin = Admin(
@@ -499,9 +1352,10 @@ def create_app():
     def clean_database():
         """Clean all countries from database"""
         try:
-            deleted_count = Country.query.count()
-            Country.query.delete()
+            # One DELETE; its rowcount is the number of countries removed
+            deleted_count = db.session.execute(db.delete(Country)).rowcount
             db.session.commit()
+            invalidate_country_cache()
 
             return jsonify({
                 'success': True,
@@ -527,8 +1381,7 @@ def create_app():
                     'error': 'No JSON data provided'
                 }), 400
 
-            required_fields = ['country_code', 'country_name', 'polygon_data']
-            missing_fields = [field for field in required_fields if not data.get(field)]
+            missing_fields = [field for field in ADD_COUNTRY_FIELDS if not data.get(field)]
 
             if missing_fields:
                 return jsonify({
@@ -536,17 +1389,19 @@ def create_app():
                     'error': f'Missing required fields: {", ".join(missing_fields)}'
                 }), 400
 
-            # Validate JSON format of polygon data
+            # Validate JSON format of polygon data, keeping the parsed geometry
             try:
-                json.loads(data['polygon_data'])
-            except json.JSONDecodeError:
+                geometry = parse_polygon(orjson.loads(data['polygon_data']))
+            except orjson.JSONDecodeError:
                 return jsonify({
                     'success': False,
                     'error': 'Invalid JSON format for polygon data'
                 }), 400
 
             # Check if country already exists
-            existing_country = Country.query.filter_by(country_code=data['country_code'].upper()).first()
+            country_code = data['country_code'].upper()
+            # Only the id is needed; don't drag the polygon columns over the wire
+            existing_country = db.session.query(Country.id).filter_by(country_code=country_code).first()
             if existing_country:
                 return jsonify({
                     'success': False,
@@ -555,13 +1410,16 @@ def create_app():
 
             # Create new country
             new_country = Country(
-                country_code=data['country_code'].upper(),
+                country_code=country_code,
                 country_name=data['country_name'],
-                polygon_data=data['polygon_data']
+                polygon_data=data['polygon_data'],
+                polygon_wkb=polygon_to_wkb(geometry)
             )
 
             db.session.add(new_country)
             db.session.commit()
+            invalidate_country_cache(country_code)
+            cache_country_record(country_code, data['country_name'], geometry)
 
             return jsonify({
                 'success': True,
@@ -574,6 +1432,98 @@ def create_app():
                 'error': f'Failed to add country: {str(e)}'
             }), 500
 
+    @app.route('/admin/add-countries', methods=['POST'])
+    @login_required
+    def add_countries():
+        """
+        Add many countries at once from exterior ring coordinates.
+
+        Expected JSON payload:
+        {
+            "countries": [
+                {"country_code": "ABC", "country_name": "Example", "coordinates": [[lon, lat], ...]}
+            ]
+        }
+        """
+        try:
+            data = request.get_json()
+
+            if not data or not isinstance(data.get('countries'), list) or not data['countries']:
+                return jsonify({
+                    'success': False,
+                    'error': 'A non-empty countries list is required'
+                }), 400
+
+            if not SHAPELY_AVAILABLE:
+                return jsonify({
+                    'success': False,
+                    'error': 'Shapely is required to build polygons'
+                }), 500
+
+            codes, names, rings = [], [], []
+            for position, country_data in enumerate(data['countries']):
+                if not isinstance(country_data, dict):
+                    country_data = {}
+                missing_fields = [field for field in ADD_COUNTRIES_FIELDS if not country_data.get(field)]
+                if missing_fields:
+                    return jsonify({
+                        'success': False,
+                        'error': f'Country #{position}: missing required fields: {", ".join(missing_fields)}'
+                    }), 400
+
+                try:
+                    ring = np.asarray(country_data['coordinates'], dtype=np.float64)
+                except (ValueError, TypeError):
+                    ring = None
+                if ring is None or ring.ndim != 2 or ring.shape[1] != 2 or len(ring) < 3:
+                    return jsonify({
+                        'success': False,
+                        'error': f'Country #{position}: coordinates must be at least 3 [longitude, latitude] pairs'
+                    }), 400
+
+                codes.append(country_data['country_code'].upper())
+                names.append(country_data['country_name'])
+                rings.append(ring)
+
+            if len(set(codes)) != len(codes):
+                return jsonify({
+                    'success': False,
+                    'error': 'Duplicate country codes in request'
+                }), 400
+
+            # Build every polygon in one vectorized call; linearrings closes open rings
+            ring_index = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+            geometries = shapely.polygons(shapely.linearrings(np.concatenate(rings), indices=ring_index))
+            polygon_data = shapely.to_geojson(geometries)
+            polygon_wkbs = shapely.to_wkb(geometries, include_srid=False)
+
+            inserted_codes = insert_new_countries([
+                {
+                    'country_code': code,
+                    'country_name': name,
+                    'polygon_data': polygon_json,
+                    'polygon_wkb': polygon_wkb
+                }
+                for code, name, polygon_json, polygon_wkb in zip(codes, names, polygon_data, polygon_wkbs)
+            ])
+            db.session.commit()
+            if inserted_codes:
+                invalidate_country_cache()
+
+            added_codes = [code for code in codes if code in inserted_codes]
+            return jsonify({
+                'success': True,
+                'message': f'{len(added_codes)} countries added successfully',
+                'countries_added': added_codes,
+                'countries_skipped': sorted(set(codes) - inserted_codes)
+            })
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({
+                'success': False,
+                'error': f'Failed to add countries: {str(e)}'
+            }), 500
+
     @app.route('/admin/remove-country', methods=['POST'])
     @login_required
     def remove_country():
@@ -587,15 +1537,16 @@ def create_app():
                     'error': 'Country code is required'
                 }), 400
 
-            country = Country.query.filter_by(country_code=data['country_code'].upper()).first()
-            if not country:
+            # Bulk delete by code: a single DELETE, no row load beforehand
+            deleted = Country.query.filter_by(country_code=data['country_code'].upper()).delete(synchronize_session=False)
+            if not deleted:
                 return jsonify({
                     'success': False,
                     'error': f'Country with code {data["country_code"]} not found'
                 }), 404
 
-            db.session.delete(country)
             db.session.commit()
+            invalidate_country_cache(data['country_code'].upper())
 
             return jsonify({
                 'success': True,
@@ -637,15 +1588,17 @@ def create_app():
                 }), 404
 
             # Check if this is the last admin
-            admin_count = Admin.query.count()
+            admin_count = count_rows(Admin)
             if admin_count <= 1:
                 return jsonify({
                     'success': False,
                     'error': 'Cannot remove the last admin user'
                 }), 400
 
+            removed_id = admin_to_remove.id
             db.session.delete(admin_to_remove)
             db.session.commit()
+            _ADMIN_CACHE.pop(removed_id, None)
 
             return jsonify({
                 'success': True,
@@ -680,8 +1633,11 @@ def create_app():
     def admin_stats():
         """Get admin statistics"""
         try:
-            countries_count = Country.query.count()
-            admins_count = Admin.query.count()
+            # Both counts as scalar subqueries in a single round-trip
+            countries_count, admins_count = db.session.execute(db.select(
+                db.select(db.func.count()).select_from(Country).scalar_subquery(),
+                db.select(db.func.count()).select_from(Admin).scalar_subquery()
+            )).one()
 
             return jsonify({
                 'success': True,
@@ -696,21 +1652,82 @@ def create_app():
                 'error': f'Failed to get statistics: {str(e)}'
             }), 500
 
+    @app.before_request
+    def init_db_once():
+        # Servers that did not run init_db() before forking (flask run, plain WSGI
+        # hosts) initialize on the first request instead of at import time
+        if not _DB_INITIALIZED:
+            ensure_db_initialized(app)
+
+    warm_kernels()
+
     app.logger.info("Application startup completed")
     return app
 
+def ensure_schema():
+    """Create missing tables and add columns introduced after the initial schema"""
+    db.create_all()
+
+    existing_columns = {column['name'] for column in db.inspect(db.engine).get_columns('countries')}
+    for column in (Country.__table__.c.polygon_wkb,):
+        if column.name not in existing_columns:
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            with db.engine.begin() as connection:
+                connection.execute(db.text(f'ALTER TABLE countries ADD COLUMN {column.name} {column_type}'))
+
+def backfill_polygon_wkb():
+    """Fill polygon_wkb for rows stored before the column existed; returns rows updated"""
+    if not SHAPELY_AVAILABLE:
+        return 0
+
+    rows = db.session.execute(
+        db.select(Country.id, Country.polygon_data, Country.updated_at)
+        .where(Country.polygon_wkb.is_(None))
+    ).all()
+
+    updates = []
+    for country_id, polygon_data, updated_at in rows:
+        polygon_wkb = polygon_to_wkb(load_polygon(polygon_data))
+        if polygon_wkb is not None:
+            # Keep updated_at so the backfill does not look like a data change
+            updates.append({'id': country_id, 'polygon_wkb': polygon_wkb, 'updated_at': updated_at})
+
+    if updates:
+        db.session.bulk_update_mappings(Country, updates)
+        db.session.commit()
+    return len(updates)
+
+_DB_INITIALIZED = False
+_DB_INIT_LOCK = threading.Lock()
+
+def ensure_db_initialized(app):
+    """Run init_db() once per process, whichever thread gets here first"""
+    with _DB_INIT_LOCK:
+        if not _DB_INITIALIZED:
+            init_db(app)
+
 def init_db(app):
     """Initialize database tables - called separately to avoid blocking startup"""
+    global _DB_INITIALIZED
     if not os.getenv('DATABASE_URL'):
         app.logger.info("No database URL provided, skipping table creation")
+        _DB_INITIALIZED = True
         return
 
     try:
         with app.app_context():
-            db.create_all()
+            ensure_schema()
             app.logger.info("Database tables created successfully")
+            backfilled = backfill_polygon_wkb()
+            if backfilled:
+                app.logger.info(f"Stored WKB polygons for {backfilled} existing countries")
+            warm_country_cache()
+            app.logger.info(f"Country cache warmed with {len(_COUNTRY_CACHE)} countries")
     except Exception as e:
         app.logger.error(f"Error creating database tables: {e}")
+    finally:
+        # One attempt per process; a failure is logged, not retried on every request
+        _DB_INITIALIZED = True
 
 print("Starting Country API Service...")
 
@@ -722,46 +1739,12 @@ except Exception as e:
     print(f"Failed to create Flask app: {e}")
     raise
 
-# Initialize database in a separate call
-try:
-    init_db(app)
-except Exception as e:
-    print(f"Database initialization failed, but continuing: {e}")
-
-# Helper Functions
-def is_point_in_polygon(lat, lon, polygon_data):
-    """Check if a point (lat, lon) is inside a polygon."""
-    if not SHAPELY_AVAILABLE:
-        print("Warning: Cannot perform point-in-polygon check without Shapely library")
-        return False
-
-    try:
-        # Parse polygon data
-        polygon_json = json.loads(polygon_data)
-
-        # Create Shapely Point and Polygon objects
-        point = Point(lon, lat)  # Note: Shapely uses (x, y) = (lon, lat)
-
-        if polygon_json['type'] == 'Polygon':
-            # Single polygon
-            coordinates = polygon_json['coordinates'][0]  # Exterior ring
-            polygon = Polygon(coordinates)
-            return polygon.contains(point)
-        elif polygon_json['type'] == 'MultiPolygon':
-            # Multiple polygons
-            for polygon_coords in polygon_json['coordinates']:
-                polygon = Polygon(polygon_coords[0])  # Exterior ring of each polygon
-                if polygon.contains(point):
-                    return True
-            return False
-        else:
-            return False
-
-    except (json.JSONDecodeError, KeyError, IndexError, ValueError) as e:
-        print(f"Error processing polygon data: {e}")
-        return False
+# Database setup runs in gunicorn's when_ready hook (see gunicorn.conf.py) or on
+# the first request, so importing the module never touches the database
 
 if __name__ == '__main__':
+    init_db(app)
+
     # Run the application in development mode
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
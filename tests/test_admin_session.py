@@ -0,0 +1,50 @@
+"""Admin login flow through the test client, including the flashed-message session cookie."""
+import pytest
+
+from server import app as country_app
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'admin.db'}")
+    app = country_app.create_app()
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with app.test_client() as client:
+        assert client.post('/admin/init-admins').get_json()['success']
+        yield client
+
+
+def login(client, password='123456'):
+    return client.post('/admin/login', data={'username': 'liron1219', 'password': password},
+                       follow_redirects=True)
+
+
+def test_dashboard_redirects_to_login_with_flash(client):
+    response = client.get('/admin/dashboard', follow_redirects=True)
+
+    assert response.status_code == 200
+    assert response.request.path == '/admin/login'
+    assert b'Please log in to access the admin panel.' in response.data
+
+
+def test_login_dashboard_logout(client):
+    response = login(client)
+    assert response.status_code == 200
+    assert response.request.path == '/admin/dashboard'
+    assert b'Logged in successfully!' in response.data
+
+    assert client.get('/admin/dashboard').status_code == 200
+
+    response = client.get('/admin/logout', follow_redirects=True)
+    assert response.status_code == 200
+    assert response.request.path == '/admin/login'
+    assert b'You have been logged out.' in response.data
+    assert client.get('/admin/dashboard').status_code == 302
+
+
+def test_wrong_password_stays_on_login(client):
+    response = login(client, password='wrong')
+
+    assert response.status_code == 200
+    assert response.request.path == '/admin/login'
+    assert b'Invalid username or password.' in response.data
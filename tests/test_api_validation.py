@@ -0,0 +1,62 @@
+"""Request validation on the public JSON endpoints."""
+import pytest
+
+from server import app as country_app
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'api.db'}")
+    app = country_app.create_app()
+    app.config.update(TESTING=True)
+    with app.test_client() as client:
+        assert client.post('/api/v1/init-db').get_json()['success']
+        yield client
+
+
+def post(client, path, body):
+    return client.post(path, data=body, content_type='application/json')
+
+
+@pytest.mark.parametrize('body, error', [
+    (b'{bad', 'Invalid JSON'),
+    (b'', 'No JSON data provided'),
+    (b'[1, 2]', 'No JSON data provided'),
+    (b'{"country_code": "ISR", "points": [["nan", 35]]}', 'Invalid latitude or longitude format'),
+    (b'{"country_code": "ISR", "points": [[31, "inf"]]}', 'Invalid latitude or longitude format'),
+    (b'{"country_code": "ISR", "points": [[95, 35]]}', 'Latitude must be between -90 and 90'),
+])
+def test_check_batch_rejects_bad_payloads(client, body, error):
+    response = post(client, '/api/v1/check_batch', body)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'success': False, 'error': error}
+
+
+def test_check_batch_results(client):
+    response = post(client, '/api/v1/check_batch', b'{"country_code": "isr", "points": [[31, 35], [33.4, 35], [40, 35]]}')
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['results'] == [True, False, False]
+
+
+@pytest.mark.parametrize('body, status, error', [
+    (b'{bad', 400, 'Invalid JSON'),
+    (b'', 400, 'No JSON data provided'),
+    (b'[1, 2]', 400, 'No JSON data provided'),
+    (b'{"latitude": "nan", "longitude": 35}', 400, 'Invalid latitude or longitude format'),
+    (b'{"latitude": 31, "longitude": 35, "pad": "' + b'x' * 5000 + b'"}', 413,
+     f'Request body must be at most {country_app.MAX_CHECK_BODY} bytes'),
+])
+def test_locate_rejects_bad_payloads(client, body, status, error):
+    response = post(client, '/api/v1/locate', body)
+
+    assert response.status_code == status
+    assert response.get_json() == {'success': False, 'error': error}
+
+
+def test_locate_finds_country(client):
+    response = post(client, '/api/v1/locate', b'{"latitude": 31, "longitude": 35}')
+
+    assert response.status_code == 200
+    assert [country['country_code'] for country in response.get_json()['data']['countries']] == ['ISR']
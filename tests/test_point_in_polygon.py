@@ -0,0 +1,110 @@
+"""Point-in-polygon kernels must agree with shapely.contains_xy, borders included."""
+import numpy as np
+import pytest
+
+pytest.importorskip('numba')
+shapely = pytest.importorskip('shapely')
+
+from server import app as country_app  # noqa: E402
+
+if not (country_app.NUMBA_AVAILABLE and country_app.SHAPELY_AVAILABLE):
+    pytest.skip('Numba kernels are disabled', allow_module_level=True)
+
+# The init-db sample rectangles plus shapes with diagonal edges, concave
+# vertices and a hole. Diagonal-edge vertices are dyadic so edge midpoints lie
+# exactly on the edge; the kernels only promise exact border answers there.
+POLYGONS = {
+    'usa': shapely.box(-125, 25, -66, 49),
+    'isr': shapely.Polygon([(34.2, 29.5), (35.9, 29.5), (35.9, 33.4), (34.2, 33.4)]),
+    'triangle': shapely.Polygon([(0, 0), (4, 0), (0, 4)]),
+    'star': shapely.Polygon([
+        (0, 3), (1, 1), (3, 1), (1.5, -0.5), (2, -3),
+        (0, -1.5), (-2, -3), (-1.5, -0.5), (-3, 1), (-1, 1)
+    ]),
+    'notch': shapely.Polygon([(0, 0), (6, 0), (6, 6), (3, 3), (0, 6)]),
+}
+HOLED = shapely.Polygon(
+    [(0, 0), (10, 0), (10, 10), (0, 10)],
+    holes=[[(3, 3), (7, 3), (7, 7), (3, 7)]]
+)
+
+
+def border_points(geometry):
+    """Every vertex and edge midpoint of a geometry's rings, as (xs, ys)."""
+    points = []
+    for part in shapely.get_parts(geometry):
+        for ring in (part.exterior, *part.interiors):
+            coords = shapely.get_coordinates(ring)
+            points.append(coords)
+            points.append((coords[:-1] + coords[1:]) / 2)
+    points = np.concatenate(points)
+    return points[:, 0], points[:, 1]
+
+
+def sample_points(geometry, count=2000, seed=0):
+    """Random points around a geometry plus its border points, as (xs, ys)."""
+    rng = np.random.default_rng(seed)
+    min_x, min_y, max_x, max_y = geometry.bounds
+    xs = rng.uniform(min_x - 1, max_x + 1, count)
+    ys = rng.uniform(min_y - 1, max_y + 1, count)
+    border_xs, border_ys = border_points(geometry)
+    return np.concatenate([xs, border_xs]), np.concatenate([ys, border_ys])
+
+
+def ring_index_hits(geometry, xs, ys):
+    """pip_all answers for a single-country RingIndex."""
+    rings = country_app.build_ring_index([geometry])
+    return np.array([
+        pip_all_hit(rings, x, y) for x, y in zip(xs, ys)
+    ])
+
+
+def pip_all_hit(rings, x, y):
+    hits = country_app.pip_all(x, y, rings.coords, rings.ring_offsets, rings.part_offsets, rings.part_bbox)
+    return bool(hits.any())
+
+
+@pytest.mark.parametrize('name', sorted(POLYGONS))
+def test_pip_ray_matches_shapely(name):
+    geometry = POLYGONS[name]
+    xs, ys = sample_points(geometry)
+    ring = country_app.simple_ring(geometry)
+
+    expected = shapely.contains_xy(geometry, xs, ys)
+    actual = np.array([country_app.pip_ray(x, y, *ring) for x, y in zip(xs, ys)])
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('name', sorted(POLYGONS))
+def test_pip_batch_matches_shapely(name):
+    geometry = POLYGONS[name]
+    xs, ys = sample_points(geometry)
+    ring = country_app.simple_ring(geometry)
+
+    np.testing.assert_array_equal(country_app.pip_batch(xs, ys, *ring), shapely.contains_xy(geometry, xs, ys))
+
+
+@pytest.mark.parametrize('geometry', [*POLYGONS.values(), HOLED], ids=[*POLYGONS, 'holed'])
+def test_pip_all_matches_shapely(geometry):
+    xs, ys = sample_points(geometry, count=500)
+
+    np.testing.assert_array_equal(ring_index_hits(geometry, xs, ys), shapely.contains_xy(geometry, xs, ys))
+
+
+@pytest.mark.parametrize('lat, lon', [
+    (33.4, 35.0),   # top edge
+    (31.0, 34.2),   # left edge
+    (29.5, 35.0),   # bottom edge
+    (31.0, 35.9),   # right edge
+    (29.5, 34.2),   # vertex
+    (31.0, 35.0),   # inside
+    (34.0, 35.0),   # outside
+])
+def test_check_and_locate_agree_on_sample_border(lat, lon):
+    geometry = POLYGONS['isr']
+    expected = bool(shapely.contains_xy(geometry, lon, lat))
+    record = country_app.cache_country_record('TST', 'Test', shapely.from_wkb(shapely.to_wkb(geometry)))
+
+    assert country_app.is_point_in_polygon(lat, lon, record) == expected
+    assert country_app.points_in_polygon(np.array([lat]), np.array([lon]), record).tolist() == [expected]
+    assert pip_all_hit(country_app.build_ring_index([geometry]), lon, lat) == expected